@@ -246,6 +246,18 @@ def class_sensitive(types = None,
 
     """
     def decorator(func):
+        # Resolve the primary type once at decoration time so that setter calls
+        # which already carry an instance of it can skip validate_types()
+        # entirely.
+        try:
+            types_list = [x for x in types]
+        except TypeError:
+            types_list = [types]
+
+        primary_type = types_list[0] if types_list else None
+        if not isinstance(primary_type, type):
+            primary_type = None
+
         @wraps(func)
         def func_wrapper(*args,
                          **kwargs):
@@ -257,6 +269,11 @@ def class_sensitive(types = None,
                 raise errors.HighchartsError('Something went wrong. Unsure how this '
                                              'might happen.')
 
+            # Falsy instances (e.g. an empty JavaScriptDict) still go through
+            # validate_types() so its allow_none normalization applies.
+            if primary_type is not None and value and isinstance(value, primary_type):
+                return func(args[0], value)
+
             value = validate_types(value,
                                    types = types,
                                    allow_dict = allow_dict,
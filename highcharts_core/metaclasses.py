@@ -34,6 +34,8 @@ class HighchartsMeta(ABC):
     """Metaclass that is used to define the standard interface exposed for serializable
     objects."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         for key in kwargs:
             setattr(self, key, kwargs.get(key, None))
@@ -88,8 +90,13 @@ class HighchartsMeta(ABC):
         if not scripts:
             scripts = []
         
+        keys = list(getattr(self, '__dict__', ()))
+        for klass in self.__class__.__mro__:
+            keys.extend(x for x in getattr(klass, '__slots__', ())
+                        if x not in keys)
+
         properties = {}
-        for key in self.__dict__:
+        for key in keys:
             if key[0] != '_':
                 continue
 
@@ -177,7 +184,12 @@ class HighchartsMeta(ABC):
         """
         return utility_functions.mro__to_untrimmed_dict(self, in_cls = in_cls)
 
-    @abstractmethod
+    #: Class-level tuple of ``(json_key, attribute_name)`` pairs. Classes which
+    #: populate this tuple get their :meth:`_to_untrimmed_dict()
+    #: <HighchartsMeta._to_untrimmed_dict>` behavior for free from the shared
+    #: spec-driven implementation below, rather than hand-writing a dict literal.
+    __serialize_spec__ = ()
+
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
         """Generate the first-level of the :class:`dict <python:dict>` representation of
         the object.
@@ -189,9 +201,18 @@ class HighchartsMeta(ABC):
           way there to replace the Highcharts for Python keys with their correpsond
           Highcharts JS keys.
 
+        .. note::
+
+          The default implementation walks the class-level ``__serialize_spec__``
+          tuple of ``(json_key, attribute_name)`` pairs, skipping
+          :obj:`None <python:None>` values. Classes whose serialization cannot be
+          expressed as a flat spec override this method instead.
+
         :rtype: :class:`dict <python:dict>`
         """
-        raise NotImplementedError()
+        return {key: value
+                for key, attr in self.__serialize_spec__
+                if (value := getattr(self, attr, None)) is not None}
 
     @staticmethod
     def trim_iterable(untrimmed,
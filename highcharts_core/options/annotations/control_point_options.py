@@ -1,4 +1,7 @@
+import copy
+
 from typing import Optional
+from functools import lru_cache
 
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.metaclasses import HighchartsMeta
@@ -8,9 +11,9 @@ from highcharts_core.utility_classes.javascript_functions import CallbackFunctio
 class AnnotationControlPointOption(HighchartsMeta):
     """Options for annotation's control points."""
 
-    def __init__(self, **kwargs):
-        self._positioner = None
+    __slots__ = ('_positioner',)
 
+    def __init__(self, **kwargs):
         self.positioner = kwargs.get('positioner', None)
 
     @property
@@ -39,6 +42,61 @@ class AnnotationControlPointOption(HighchartsMeta):
     def positioner(self, value):
         self._positioner = value
 
+    @classmethod
+    @lru_cache(maxsize = 256)
+    def _from_dict_items(cls, items, allow_snake_case):
+        """Construct (and cache) a template instance from a hashable ``items``
+        representation of the source :class:`dict <python:dict>`.
+
+        :rtype: :class:`AnnotationControlPointOption`
+        """
+        return super().from_dict(dict(items), allow_snake_case = allow_snake_case)
+
+    @classmethod
+    def from_dict(cls,
+                  as_dict: dict,
+                  allow_snake_case: bool = True):
+        """Construct an instance of the class from a :class:`dict <python:dict>` object.
+
+        .. note::
+
+          Repeated identical inputs are resolved from a bounded cache, with each
+          call returning a fresh copy of the cached template.
+
+        :param as_dict: A :class:`dict <python:dict>` representation of the object.
+        :type as_dict: :class:`dict <python:dict>`
+
+        :param allow_snake_case: If ``True``, interprets ``snake_case`` keys as equivalent
+          to ``camelCase`` keys. Defaults to ``True``.
+        :type allow_snake_case: :class:`bool <python:bool>`
+
+        :returns: A Python object representation of ``as_dict``.
+        :rtype: :class:`AnnotationControlPointOption`
+        """
+        if isinstance(as_dict, dict):
+            positioner = as_dict.get('positioner', None)
+            if positioner is None or isinstance(positioner, CallbackFunction):
+                instance = cls.__new__(cls)
+                instance._positioner = positioner
+
+                return instance
+
+        try:
+            items = tuple(sorted((as_dict or {}).items()))
+            template = cls._from_dict_items(items, allow_snake_case)
+        except (TypeError, AttributeError):
+            return super().from_dict(as_dict, allow_snake_case = allow_snake_case)
+
+        instance = cls.__new__(cls)
+        positioner = template._positioner
+        if positioner is not None:
+            # Materialize a fresh copy so instances resolved from the cache do
+            # not share (and cannot mutate) the template's CallbackFunction.
+            positioner = copy.deepcopy(positioner)
+        instance._positioner = positioner
+
+        return instance
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
@@ -47,9 +105,6 @@ class AnnotationControlPointOption(HighchartsMeta):
 
         return kwargs
 
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'positioner': self.positioner
-        }
-
-        return untrimmed
+    __serialize_spec__ = (
+        ('positioner', '_positioner'),
+    )
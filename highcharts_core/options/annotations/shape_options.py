@@ -337,7 +337,7 @@ class ShapeOptions(ShapeOptionsBase):
 
     @property
     def r(self) -> Optional[int | float | Decimal]:
-        f"""The radius of the shape in pixels. Defaults to {constants.DEFAULT_SHAPES_R}.
+        """The radius of the shape in pixels. Defaults to ``0``.
 
         :rtype: numeric or :obj:`None <python:None>`
         """
@@ -349,7 +349,7 @@ class ShapeOptions(ShapeOptionsBase):
 
     @property
     def type(self) -> Optional[str]:
-        f"""The type of the shape. Defaults to ``{constants.DEFAULT_SHAPES_TYPE}``.
+        """The type of the shape. Defaults to ``'rect'``.
 
         Accepts:
 
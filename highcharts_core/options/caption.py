@@ -1,11 +1,17 @@
+import sys
+
 from typing import Optional
 from decimal import Decimal
+from functools import lru_cache
 
 from validator_collection import validators
 
-from highcharts_core import constants, errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.metaclasses import HighchartsMeta
 
+_ALIGN_VALUES = utility_functions.ALIGN_VALUES
+_VERTICAL_ALIGN_VALUES = utility_functions.VERTICAL_ALIGN_VALUES
+
 
 class Caption(HighchartsMeta):
     """The chart's caption, which will render below the chart and will be part of
@@ -18,17 +24,19 @@ class Caption(HighchartsMeta):
 
     """
 
-    def __init__(self, **kwargs):
-        self._align = None
-        self._floating = None
-        self._margin = None
-        self._style = None
-        self._text = None
-        self._use_html = None
-        self._vertical_align = None
-        self._x = None
-        self._y = None
+    __slots__ = (
+        '_align',
+        '_floating',
+        '_margin',
+        '_style',
+        '_text',
+        '_use_html',
+        '_vertical_align',
+        '_x',
+        '_y',
+    )
 
+    def __init__(self, **kwargs):
         self.align = kwargs.get('align', None)
         self.floating = kwargs.get('floating', None)
         self.margin = kwargs.get('margin', None)
@@ -66,14 +74,16 @@ class Caption(HighchartsMeta):
     def align(self, value):
         if not value:
             self._align = None
+        elif type(value) is str and value in _ALIGN_VALUES:
+            self._align = sys.intern(value)
         else:
             value = validators.string(value, allow_empty = False)
             value = value.lower()
-            if value not in ['left', 'center', 'right']:
+            if value not in _ALIGN_VALUES:
                 raise errors.HighchartsValueError(f'align must be either "left", '
                                                   f'"center", or "right". Was: {value}')
 
-        self._align = value
+            self._align = sys.intern(value)
 
     @property
     def floating(self) -> Optional[bool]:
@@ -170,15 +180,19 @@ class Caption(HighchartsMeta):
 
     @vertical_align.setter
     def vertical_align(self, value):
+        if type(value) is str and value in _VERTICAL_ALIGN_VALUES:
+            self._vertical_align = sys.intern(value)
+            return
+
         value = validators.string(value, allow_empty = True)
         if not value:
             self._vertical_align = None
         else:
             value = value.lower()
-            if value not in ['bottom', 'middle', 'top']:
+            if value not in _VERTICAL_ALIGN_VALUES:
                 raise errors.HighchartsValueError(f'vertical_align expects either "top", '
                                                   f'"middle", or "bottom". Was: {value}')
-            self._vertical_align = value
+            self._vertical_align = sys.intern(value)
 
     @property
     def x(self) -> Optional[int | float | Decimal]:
@@ -195,7 +209,7 @@ class Caption(HighchartsMeta):
         self._x = validators.numeric(value, allow_empty = True)
 
     @property
-    def y(self) -> Optional[int]:
+    def y(self) -> Optional[int | float | Decimal]:
         """The y position of the caption relative to the alignment within
         :meth:`Options.chart.spacing_left` and :meth:`Option.chart.spacing_right`.
         Defaults to ``None``.
@@ -208,6 +222,50 @@ class Caption(HighchartsMeta):
     def y(self, value):
         self._y = validators.numeric(value, allow_empty = True)
 
+    @classmethod
+    @lru_cache(maxsize = 256)
+    def _from_dict_items(cls, items, allow_snake_case):
+        """Construct (and cache) a template instance from a hashable ``items``
+        representation of the source :class:`dict <python:dict>`.
+
+        :rtype: :class:`Caption`
+        """
+        return super().from_dict(dict(items), allow_snake_case = allow_snake_case)
+
+    @classmethod
+    def from_dict(cls,
+                  as_dict: dict,
+                  allow_snake_case: bool = True):
+        """Construct an instance of the class from a :class:`dict <python:dict>` object.
+
+        .. note::
+
+          Repeated identical inputs (e.g. a caption template applied across many
+          charts) are resolved from a bounded cache, with each call returning a
+          fresh copy of the cached template.
+
+        :param as_dict: A :class:`dict <python:dict>` representation of the object.
+        :type as_dict: :class:`dict <python:dict>`
+
+        :param allow_snake_case: If ``True``, interprets ``snake_case`` keys as equivalent
+          to ``camelCase`` keys. Defaults to ``True``.
+        :type allow_snake_case: :class:`bool <python:bool>`
+
+        :returns: A Python object representation of ``as_dict``.
+        :rtype: :class:`Caption`
+        """
+        try:
+            items = tuple(sorted((as_dict or {}).items()))
+            template = cls._from_dict_items(items, allow_snake_case)
+        except (TypeError, AttributeError):
+            # Unhashable values (e.g. a style dict) cannot be cache keys.
+            return super().from_dict(as_dict, allow_snake_case = allow_snake_case)
+        instance = cls.__new__(cls)
+        for attr in cls.__slots__:
+            setattr(instance, attr, getattr(template, attr))
+
+        return instance
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         kwargs = {
@@ -224,17 +282,14 @@ class Caption(HighchartsMeta):
 
         return kwargs
 
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'align': self.align,
-            'floating': self.floating,
-            'margin': self.margin,
-            'style': self.style,
-            'text': self.text,
-            'useHTML': self.use_html,
-            'verticalAlign': self.vertical_align,
-            'x': self.x,
-            'y': self.y
-        }
-
-        return untrimmed
+    __serialize_spec__ = (
+        ('align', '_align'),
+        ('floating', '_floating'),
+        ('margin', '_margin'),
+        ('style', '_style'),
+        ('text', '_text'),
+        ('useHTML', '_use_html'),
+        ('verticalAlign', '_vertical_align'),
+        ('x', '_x'),
+        ('y', '_y'),
+    )
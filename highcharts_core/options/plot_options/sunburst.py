@@ -1,18 +1,131 @@
+from __future__ import annotations
+
+import re
+import sys
+
+from importlib import import_module
 from typing import Optional, List
 from decimal import Decimal
 
 from validator_collection import validators, checkers
 
-from highcharts_core import constants, errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.decorators import class_sensitive, validate_types
+from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.options.plot_options.generic import GenericTypeOptions
-from highcharts_core.options.plot_options.levels import SunburstLevelOptions, LevelSize
-from highcharts_core.utility_classes.gradients import Gradient
-from highcharts_core.utility_classes.patterns import Pattern
-from highcharts_core.utility_classes.breadcrumbs import BreadcrumbOptions
-from highcharts_core.utility_classes.shadows import ShadowOptions
-from highcharts_core.utility_classes.data_labels import SunburstDataLabel
-from highcharts_core.utility_classes.border_radius import BorderRadius
+
+#: Names historically importable from this module, resolved lazily via the
+#: PEP 562 module ``__getattr__`` below so that importing ``sunburst`` does not
+#: pull in the gradient/pattern/shadow machinery until it is actually used.
+_LAZY_IMPORTS = {
+    'SunburstLevelOptions': 'highcharts_core.options.plot_options.levels',
+    'LevelSize': 'highcharts_core.options.plot_options.levels',
+    'Gradient': 'highcharts_core.utility_classes.gradients',
+    'Pattern': 'highcharts_core.utility_classes.patterns',
+    'BreadcrumbOptions': 'highcharts_core.utility_classes.breadcrumbs',
+    'ShadowOptions': 'highcharts_core.utility_classes.shadows',
+    'SunburstDataLabel': 'highcharts_core.utility_classes.data_labels',
+    'BorderRadius': 'highcharts_core.utility_classes.border_radius',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+
+    return value
+
+#: Types which can skip ``validators.numeric`` entirely (``bool`` is excluded
+#: deliberately - it is an ``int`` subclass but not a meaningful measurement).
+_FAST_NUMERIC_TYPES = utility_functions.FAST_NUMERIC_TYPES
+
+#: Canonical percentage strings (e.g. ``'50%'``, ``'-12.5%'``) which can skip
+#: validation entirely in the ``size`` / ``center`` setters.
+_PERCENTAGE_RE = re.compile(r'-?\d+(?:\.\d+)?%$')
+
+
+#: ``(python_key, json_key)`` pairs consumed by
+#: :meth:`SunburstOptions._get_kwargs_from_dict`, hoisted to module scope so the
+#: mapping is not rebuilt on every deserialization call.
+_SUNBURST_KWARG_MAP = (
+    ('accessibility', 'accessibility'),
+    ('allow_point_select', 'allowPointSelect'),
+    ('animation', 'animation'),
+    ('class_name', 'className'),
+    ('clip', 'clip'),
+    ('color', 'color'),
+    ('cursor', 'cursor'),
+    ('custom', 'custom'),
+    ('dash_style', 'dashStyle'),
+    ('data_labels', 'dataLabels'),
+    ('description', 'description'),
+    ('enable_mouse_tracking', 'enableMouseTracking'),
+    ('events', 'events'),
+    ('include_in_data_export', 'includeInDataExport'),
+    ('keys', 'keys'),
+    ('label', 'label'),
+    ('legend_symbol', 'legendSymbol'),
+    ('linked_to', 'linkedTo'),
+    ('marker', 'marker'),
+    ('on_point', 'onPoint'),
+    ('opacity', 'opacity'),
+    ('point', 'point'),
+    ('point_description_formatter', 'pointDescriptionFormatter'),
+    ('selected', 'selected'),
+    ('show_checkbox', 'showCheckbox'),
+    ('show_in_legend', 'showInLegend'),
+    ('skip_keyboard_navigation', 'skipKeyboardNavigation'),
+    ('sonification', 'sonification'),
+    ('states', 'states'),
+    ('sticky_tracking', 'stickyTracking'),
+    ('threshold', 'threshold'),
+    ('tooltip', 'tooltip'),
+    ('turbo_threshold', 'turboThreshold'),
+    ('visible', 'visible'),
+
+    ('allow_traversing_tree', 'allowTraversingTree'),
+    ('border_color', 'borderColor'),
+    ('border_width', 'borderWidth'),
+    ('border_radius', 'borderRadius'),
+    ('breadcrumbs', 'breadcrumbs'),
+    ('center', 'center'),
+    ('color_by_point', 'colorByPoint'),
+    ('color_index', 'colorIndex'),
+    ('crisp', 'crisp'),
+    ('fill_color', 'fillColor'),
+    ('level_is_constant', 'levelIsConstant'),
+    ('levels', 'levels'),
+    ('level_size', 'levelSize'),
+    ('root_id', 'rootId'),
+    ('shadow', 'shadow'),
+    ('size', 'size'),
+    ('sliced_offset', 'slicedOffset'),
+    ('start_angle', 'startAngle'),
+)
+
+
+def _validate_center_value(item):
+    """Validate a single ``center`` coordinate, which must be either a percentage
+    string or a number.
+
+    :raises HighchartsValueError: if ``item`` is a string without a ``'%'`` character
+    """
+    if isinstance(item, str):
+        if _PERCENTAGE_RE.match(item):
+            return item
+        if '%' not in item:
+            raise errors.HighchartsValueError('center expects either numbers '
+                                              'or percentage strings. No "%" '
+                                              'character found in string '
+                                              'received.')
+        return item
+
+    return validators.numeric(item)
 
 
 class SunburstOptions(GenericTypeOptions):
@@ -28,26 +141,28 @@ class SunburstOptions(GenericTypeOptions):
 
     """
 
-    def __init__(self, **kwargs):
-        self._border_radius = None
-        self._color_index = None
-        self._crisp = None
-        self._shadow = None
-        self._allow_traversing_tree = None
-        self._border_color = None
-        self._border_width = None
-        self._breadcrumbs = None
-        self._center = None
-        self._color_by_point = None
-        self._fill_color = None
-        self._level_is_constant = None
-        self._levels = None
-        self._level_size = None
-        self._root_id = None
-        self._size = None
-        self._sliced_offset = None
-        self._start_angle = None
+    __slots__ = (
+        '_border_radius',
+        '_color_index',
+        '_crisp',
+        '_shadow',
+        '_allow_traversing_tree',
+        '_border_color',
+        '_border_width',
+        '_breadcrumbs',
+        '_center',
+        '_color_by_point',
+        '_fill_color',
+        '_level_is_constant',
+        '_levels',
+        '_level_size',
+        '_root_id',
+        '_size',
+        '_sliced_offset',
+        '_start_angle',
+    )
 
+    def __init__(self, **kwargs):
         self.border_radius = kwargs.get('border_radius', None)
         self.color_index = kwargs.get('color_index', None)
         self.crisp = kwargs.get('crisp', None)
@@ -116,9 +231,12 @@ class SunburstOptions(GenericTypeOptions):
 
     @border_width.setter
     def border_width(self, value):
-        self._border_width = validators.numeric(value,
-                                                allow_empty = True,
-                                                minimum = 0)
+        if value is None or (type(value) in _FAST_NUMERIC_TYPES and value >= 0):
+            self._border_width = value
+        else:
+            self._border_width = validators.numeric(value,
+                                                    allow_empty = True,
+                                                    minimum = 0)
 
     @property
     def border_radius(self) -> Optional[int | float | Decimal | str | BorderRadius]:
@@ -131,6 +249,8 @@ class SunburstOptions(GenericTypeOptions):
 
     @border_radius.setter
     def border_radius(self, value):
+        from highcharts_core.utility_classes.border_radius import BorderRadius
+
         if value is None:
             self._border_radius = None
         else:
@@ -155,12 +275,24 @@ class SunburstOptions(GenericTypeOptions):
         through the traversed levels. Defaults to :obj:`None <python:None>`.
 
         """
+        if isinstance(self._breadcrumbs, dict):
+            from highcharts_core.utility_classes.breadcrumbs import BreadcrumbOptions
+
+            self._breadcrumbs = validate_types(self._breadcrumbs,
+                                               types = BreadcrumbOptions)
+
         return self._breadcrumbs
 
     @breadcrumbs.setter
-    @class_sensitive(BreadcrumbOptions)
     def breadcrumbs(self, value):
-        self._breadcrumbs = value
+        if isinstance(value, dict):
+            # Deferred: coerced to BreadcrumbOptions on first read.
+            self._breadcrumbs = value
+        else:
+            from highcharts_core.utility_classes.breadcrumbs import BreadcrumbOptions
+
+            self._breadcrumbs = validate_types(value,
+                                               types = BreadcrumbOptions)
 
     @property
     def center(self) -> Optional[List[str | int | float | Decimal | constants.EnforcedNullType]]:
@@ -189,21 +321,7 @@ class SunburstOptions(GenericTypeOptions):
                 raise errors.HighchartsValueError(f'center expects a 2-member array. '
                                                   f'Received a {len(value)}-member '
                                                   f'array.')
-            processed_values = []
-            for item in value:
-                try:
-                    item = validators.string(item)
-                    if '%' not in item:
-                        raise errors.HighchartsValueError('center expects either numbers '
-                                                          'or percentage strings. No "%" '
-                                                          'character found in string '
-                                                          'received.')
-                except TypeError:
-                    item = validators.numeric(item)
-
-                processed_values.append(item)
-
-            self._center = processed_values
+            self._center = [_validate_center_value(item) for item in value]
 
     @property
     def color_by_point(self) -> Optional[bool]:
@@ -238,9 +356,12 @@ class SunburstOptions(GenericTypeOptions):
 
     @color_index.setter
     def color_index(self, value):
-        self._color_index = validators.integer(value,
-                                               allow_empty = True,
-                                               minimum = 0)
+        if value is None or (type(value) is int and value >= 0):
+            self._color_index = value
+        else:
+            self._color_index = validators.integer(value,
+                                                   allow_empty = True,
+                                                   minimum = 0)
 
     @property
     def crisp(self) -> Optional[bool]:
@@ -283,6 +404,8 @@ class SunburstOptions(GenericTypeOptions):
 
     @data_labels.setter
     def data_labels(self, value):
+        from highcharts_core.utility_classes.data_labels import SunburstDataLabel
+
         if not value:
             self._data_labels = None
         else:
@@ -338,12 +461,27 @@ class SunburstOptions(GenericTypeOptions):
         :rtype: :obj:`None <python:None>`, or :class:`list <python:list>` of
           :class:`SunburstLevelOptions`
         """
+        if isinstance(self._levels, list):
+            from highcharts_core.options.plot_options.levels import SunburstLevelOptions
+
+            if not all(isinstance(x, SunburstLevelOptions) for x in self._levels):
+                self._levels = validate_types(self._levels,
+                                              types = SunburstLevelOptions,
+                                              force_iterable = True)
+
         return self._levels
 
     @levels.setter
-    @class_sensitive(SunburstLevelOptions, force_iterable = True)
     def levels(self, value):
-        self._levels = value
+        if isinstance(value, list) and value:
+            # Deferred: members coerced to SunburstLevelOptions on first read.
+            self._levels = value
+        else:
+            from highcharts_core.options.plot_options.levels import SunburstLevelOptions
+
+            self._levels = validate_types(value,
+                                          types = SunburstLevelOptions,
+                                          force_iterable = True)
 
     @property
     def level_size(self) -> Optional[LevelSize]:
@@ -351,12 +489,24 @@ class SunburstOptions(GenericTypeOptions):
 
         :rtype: :class:`LevelSize` or :obj:`None <python:None>`
         """
+        if isinstance(self._level_size, dict):
+            from highcharts_core.options.plot_options.levels import LevelSize
+
+            self._level_size = validate_types(self._level_size,
+                                              types = LevelSize)
+
         return self._level_size
 
     @level_size.setter
-    @class_sensitive(LevelSize)
     def level_size(self, value):
-        self._level_size = value
+        if isinstance(value, dict):
+            # Deferred: coerced to LevelSize on first read.
+            self._level_size = value
+        else:
+            from highcharts_core.options.plot_options.levels import LevelSize
+
+            self._level_size = validate_types(value,
+                                              types = LevelSize)
 
     @property
     def root_id(self) -> Optional[str]:
@@ -369,7 +519,10 @@ class SunburstOptions(GenericTypeOptions):
 
     @root_id.setter
     def root_id(self, value):
-        self._root_id = validators.string(value, allow_empty = True)
+        if value is None or (type(value) is str and value):
+            self._root_id = value
+        else:
+            self._root_id = validators.string(value, allow_empty = True)
 
     @property
     def shadow(self) -> Optional[bool | ShadowOptions]:
@@ -382,6 +535,12 @@ class SunburstOptions(GenericTypeOptions):
           shadow or displays the default shadow.
         :rtype: :class:`bool <python:bool>` or :class:`ShadowOptions`
         """
+        if isinstance(self._shadow, dict):
+            from highcharts_core.utility_classes.shadows import ShadowOptions
+
+            self._shadow = validate_types(self._shadow,
+                                          types = ShadowOptions)
+
         return self._shadow
 
     @shadow.setter
@@ -390,7 +549,12 @@ class SunburstOptions(GenericTypeOptions):
             self._shadow = value
         elif not value:
             self._shadow = None
+        elif isinstance(value, dict):
+            # Deferred: coerced to ShadowOptions on first read.
+            self._shadow = value
         else:
+            from highcharts_core.utility_classes.shadows import ShadowOptions
+
             value = validate_types(value,
                                    types = ShadowOptions)
             self._shadow = value
@@ -419,12 +583,15 @@ class SunburstOptions(GenericTypeOptions):
     def size(self, value):
         if value is None:
             self._size = None
+        elif isinstance(value, str) and _PERCENTAGE_RE.match(value):
+            self._size = sys.intern(value)
         else:
             try:
                 value = validators.string(value)
                 if '%' not in value:
                     raise errors.HighchartsValueError(f'size expects either a number or '
                                                       f'a % string. Received: {value}')
+                value = sys.intern(value)
             except TypeError:
                 value = validators.integer(value, minimum = 0)
 
@@ -441,7 +608,10 @@ class SunburstOptions(GenericTypeOptions):
 
     @sliced_offset.setter
     def sliced_offset(self, value):
-        self._sliced_offset = validators.numeric(value, allow_empty = True)
+        if value is None or type(value) in _FAST_NUMERIC_TYPES:
+            self._sliced_offset = value
+        else:
+            self._sliced_offset = validators.numeric(value, allow_empty = True)
 
     @property
     def start_angle(self) -> Optional[int | float | Decimal]:
@@ -454,92 +624,43 @@ class SunburstOptions(GenericTypeOptions):
 
     @start_angle.setter
     def start_angle(self, value):
-        self._start_angle = validators.numeric(value,
-                                               allow_empty = True,
-                                               minimum = 0,
-                                               maximum = 360)
+        if value is None or (type(value) in _FAST_NUMERIC_TYPES
+                             and 0 <= value <= 360):
+            self._start_angle = value
+        else:
+            self._start_angle = validators.numeric(value,
+                                                   allow_empty = True,
+                                                   minimum = 0,
+                                                   maximum = 360)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'allow_traversing_tree': as_dict.get('allowTraversingTree', None),
-            'border_color': as_dict.get('borderColor', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'border_radius': as_dict.get('borderRadius', None),
-            'breadcrumbs': as_dict.get('breadcrumbs', None),
-            'center': as_dict.get('center', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'crisp': as_dict.get('crisp', None),
-            'fill_color': as_dict.get('fillColor', None),
-            'level_is_constant': as_dict.get('levelIsConstant', None),
-            'levels': as_dict.get('levels', None),
-            'level_size': as_dict.get('levelSize', None),
-            'root_id': as_dict.get('rootId', None),
-            'shadow': as_dict.get('shadow', None),
-            'size': as_dict.get('size', None),
-            'sliced_offset': as_dict.get('slicedOffset', None),
-            'start_angle': as_dict.get('startAngle', None)
-        }
-
-        return kwargs
+        return {python_key: as_dict.get(json_key, None)
+                for python_key, json_key in _SUNBURST_KWARG_MAP}
+
+    __serialize_spec__ = (
+        ('allowTraversingTree', '_allow_traversing_tree'),
+        ('borderColor', '_border_color'),
+        ('borderWidth', '_border_width'),
+        ('borderRadius', '_border_radius'),
+        ('breadcrumbs', 'breadcrumbs'),
+        ('center', '_center'),
+        ('colorByPoint', '_color_by_point'),
+        ('colorIndex', '_color_index'),
+        ('crisp', '_crisp'),
+        ('fillColor', '_fill_color'),
+        ('levelIsConstant', '_level_is_constant'),
+        ('levels', 'levels'),
+        ('levelSize', 'level_size'),
+        ('rootId', '_root_id'),
+        ('shadow', 'shadow'),
+        ('size', '_size'),
+        ('slicedOffset', '_sliced_offset'),
+        ('startAngle', '_start_angle'),
+    )
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'allowTraversingTree': self.allow_traversing_tree,
-            'borderColor': self.border_color,
-            'borderWidth': self.border_width,
-            'borderRadius': self.border_radius,
-            'breadcrumbs': self.breadcrumbs,
-            'center': self.center,
-            'colorByPoint': self.color_by_point,
-            'colorIndex': self.color_index,
-            'crisp': self.crisp,
-            'fillColor': self.fill_color,
-            'levelIsConstant': self.level_is_constant,
-            'levels': self.levels,
-            'levelSize': self.level_size,
-            'rootId': self.root_id,
-            'shadow': self.shadow,
-            'size': self.size,
-            'slicedOffset': self.sliced_offset,
-            'startAngle': self.start_angle
-        }
+        untrimmed = HighchartsMeta._to_untrimmed_dict(self, in_cls = in_cls)
         parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
 
         for key in parent_as_dict:
@@ -24,6 +24,15 @@ class CartesianData(DataBase):
     """Data point that can be represented on a :term:`Cartesian chart <Cartesian Charts>`,
     featuring an ``x`` and ``y`` value."""
 
+    __slots__ = (
+        '_data_labels',
+        '_drag_drop',
+        '_drilldown',
+        '_marker',
+        '_x',
+        '_y',
+    )
+
     def __init__(self, **kwargs):
         self._data_labels = None
         self._drag_drop = None
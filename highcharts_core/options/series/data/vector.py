@@ -3,15 +3,31 @@ from decimal import Decimal
 
 from validator_collection import validators, checkers
 
-from highcharts_core import constants, errors
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.options.series.data.cartesian import CartesianData
 from highcharts_core.options.series.data.collections import DataPointCollection
 
+_ENULL = constants.EnforcedNull
+_ENULL_TYPE = constants.EnforcedNullType
+_fast_numeric = utility_functions.validate_numeric_fastpath
+
 
 class VectorData(CartesianData):
     """Variant of :class:`CartesianData` which extends the data point with ``direction``
     and ``length`` attributes."""
 
+    __slots__ = (
+        '_direction',
+        '_length',
+    )
+
     def __init__(self, **kwargs):
         self._direction = None
         self._length = None
@@ -32,7 +48,7 @@ class VectorData(CartesianData):
 
     @direction.setter
     def direction(self, value):
-        self._direction = validators.numeric(value, allow_empty = True)
+        self._direction = _fast_numeric(value)
 
     @property
     def length(self) -> Optional[int | float | Decimal]:
@@ -49,7 +65,7 @@ class VectorData(CartesianData):
 
     @length.setter
     def length(self, value):
-        self._length = validators.numeric(value, allow_empty = True)
+        self._length = _fast_numeric(value)
 
     @classmethod
     def from_list(cls, value):
@@ -63,37 +79,89 @@ class VectorData(CartesianData):
         elif not checkers.is_iterable(value):
             value = [value]
 
+        if HAS_NUMPY and isinstance(value, (list, tuple)) and value:
+            try:
+                as_array = np.asarray(value)
+            except (ValueError, TypeError):
+                as_array = None
+
+            if as_array is not None and as_array.ndim == 2 and \
+               as_array.dtype.kind in 'iuf' and as_array.shape[1] in (3, 4):
+                # Homogeneous numeric rows: one C-level conversion, then a
+                # bulk construction pass that skips the per-item checker
+                # dispatch below.
+                return cls._from_numeric_rows(as_array)
+
         collection = []
         for item in value:
-            if checkers.is_type(item, 'VectorData'):
+            if isinstance(item, VectorData):
                 as_obj = item
-            elif checkers.is_dict(item):
+            elif isinstance(item, dict):
                 as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif item is None or item is _ENULL or type(item) is _ENULL_TYPE:
+                # Identity against the EnforcedNull sentinel is a pointer
+                # compare; the exact-type check only runs for separately
+                # constructed EnforcedNullType instances.
                 as_obj = cls()
-            elif len(item) == 4:
-                as_obj = cls(x = item[0],
-                             y = item[1],
-                             length = item[2],
-                             direction = item[3])
-            elif len(item) == 3:
-                as_obj = cls(x = None,
-                             y = item[0],
-                             length = item[1],
-                             direction = item[2])
             else:
-                raise errors.HighchartsValueError(f'each data point supplied must either '
-                                                  f'be a Vector Data Point or be '
-                                                  f'coercable to one. Could not coerce: '
-                                                  f'{item}')
-
-            if checkers.is_string(as_obj.x) and not as_obj.name:
+                item_length = len(item)
+                if item_length == 4:
+                    # UNPACK_SEQUENCE is cheaper than four subscript ops.
+                    x, y, length, direction = item
+                    as_obj = cls(x = x,
+                                 y = y,
+                                 length = length,
+                                 direction = direction)
+                elif item_length == 3:
+                    y, length, direction = item
+                    as_obj = cls(x = None,
+                                 y = y,
+                                 length = length,
+                                 direction = direction)
+                else:
+                    raise errors.HighchartsValueError(f'each data point supplied must '
+                                                      f'either be a Vector Data Point or '
+                                                      f'be coercable to one. Could not '
+                                                      f'coerce: {item}')
+
+            if isinstance(as_obj.x, str) and not as_obj.name:
                 as_obj.name = as_obj.x
                 as_obj.x = None
             collection.append(as_obj)
 
         return collection
 
+    @classmethod
+    def _from_numeric_rows(cls, as_array) -> List:
+        """Bulk-construct data points from a homogeneous numeric NumPy array of
+        shape ``(N, 3)`` or ``(N, 4)``.
+
+        Because the values are known to be plain numerics, construction bypasses
+        ``__init__`` and the property setters entirely: each instance is stamped
+        out via ``__new__`` and its backing fields are written directly.
+
+        :param as_array: The numeric array of data point values.
+        :type as_array: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :rtype: :class:`list <python:list>` of :class:`VectorData` instances
+        """
+        rows = as_array.tolist()
+        has_x = as_array.shape[1] == 4
+        new = cls.__new__
+        fields = cls._ALL_SLOT_FIELDS
+        out = [None] * len(rows)
+        for index, row in enumerate(rows):
+            obj = new(cls)
+            for attr in fields:
+                setattr(obj, attr, None)
+            if has_x:
+                obj._x, obj._y, obj._length, obj._direction = row
+            else:
+                obj._y, obj._length, obj._direction = row
+            out[index] = obj
+
+        return out
+
     @classmethod
     def _get_supported_dimensions(cls) -> List[int]:
         """Returns a list of the supported dimensions for the data point.
@@ -152,34 +220,72 @@ class VectorData(CartesianData):
         """
         if self.requires_js_object or force_object:
             return self._to_untrimmed_dict()
-        
-        if self.y is not None:
-            y = self.y
-        else:
-            y = constants.EnforcedNull
-            
-        if self.length is not None:
-            length = self.length
-        else:
-            length = constants.EnforcedNull
-            
-        if self.direction is not None:
-            direction = self.direction
-        else:
-            direction = constants.EnforcedNull
-            
-        if self.x is not None:
-            x = self.x
-        elif self.name is not None:
-            x = self.name
-        else:
-            x = constants.EnforcedNull
-        
-        if self.x is None and self.name is None:
-            return [y, length, direction]
-        
+
+        # Bind each backing slot once rather than re-reading the property on
+        # both sides of the conditional.
+        y = self._y
+        length = self._length
+        direction = self._direction
+        if y is None:
+            y = _ENULL
+        if length is None:
+            length = _ENULL
+        if direction is None:
+            direction = _ENULL
+
+        x = self._x
+        if x is None:
+            x = self._name
+            if x is None:
+                return [y, length, direction]
+
         return [x, y, length, direction]
 
+    @classmethod
+    def to_array_batch(cls, points) -> List[List | Dict]:
+        """Generate the array representation for a collection of data points in a
+        single pass (the batch equivalent of calling :meth:`.to_array() <to_array>`
+        on each point).
+
+        Points which cannot be serialized to a primitive array fall back to their
+        individual :meth:`.to_array() <to_array>` call (and thus to their untrimmed
+        :class:`dict <python:dict>` representation).
+
+        :param points: The collection of :class:`VectorData` instances to serialize.
+        :type points: iterable of :class:`VectorData`
+
+        :returns: The array representation of each data point.
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` or
+          :class:`dict <python:dict>` values
+        """
+        enull = _ENULL
+        out = []
+        ap = out.append
+        for p in points:
+            # Any non-array property forces the (expensive) per-point object
+            # serialization path.
+            if (p._data_labels is not None or p._drag_drop is not None
+                    or p._drilldown is not None or p._marker is not None
+                    or p._accessibility is not None or p._class_name is not None
+                    or p._color is not None or p._color_index is not None
+                    or p._custom is not None or p._description is not None
+                    or p._events is not None or p._id is not None
+                    or p._label_rank is not None or p._selected is not None):
+                ap(p.to_array())
+                continue
+
+            x = p._x if p._x is not None else p._name
+            y = p._y if p._y is not None else enull
+            length = p._length if p._length is not None else enull
+            direction = p._direction if p._direction is not None else enull
+
+            if x is None:
+                ap([y, length, direction])
+            else:
+                ap([x, y, length, direction])
+
+        return out
+
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
         """Convenience method which returns the keyword arguments used to initialize the
@@ -219,32 +325,32 @@ class VectorData(CartesianData):
 
         return kwargs
 
-    def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'direction': self.direction,
-            'length': self.length,
-
-            'dataLabels': self.data_labels,
-            'dragDrop': self.drag_drop,
-            'drilldown': self.drilldown,
-            'marker': self.marker,
-            'x': self.x,
-            'y': self.y,
-
-            'accessibility': self.accessibility,
-            'className': self.class_name,
-            'color': self.color,
-            'colorIndex': self.color_index,
-            'custom': self.custom,
-            'description': self.description,
-            'events': self.events,
-            'id': self.id,
-            'labelrank': self.label_rank,
-            'name': self.name,
-            'selected': self.selected,
-        }
+    _UNTRIMMED_KEYS = ('direction', 'length', 'dataLabels', 'dragDrop', 'drilldown',
+                       'marker', 'x', 'y', 'accessibility', 'className', 'color',
+                       'colorIndex', 'custom', 'description', 'events', 'id',
+                       'labelrank', 'name', 'selected')
 
-        return untrimmed
+    def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        # All of the properties serialized here are simple pass-through getters, so
+        # the backing fields can be zipped against the (class-level) key tuple
+        # rather than rebuilding the dict literal key-by-key.
+        return dict(zip(self._UNTRIMMED_KEYS,
+                        (self._direction, self._length, self._data_labels,
+                         self._drag_drop, self._drilldown, self._marker, self._x,
+                         self._y, self._accessibility, self._class_name, self._color,
+                         self._color_index, self._custom, self._description,
+                         self._events, self._id, self._label_rank, self._name,
+                         self._selected)))
+
+
+# Every backing field across the VectorData slot chain, used by
+# _from_numeric_rows() to stamp out blank instances without running __init__.
+# Derived from the MRO so slots added to (or renamed in) the ancestor classes
+# are picked up automatically.
+VectorData._ALL_SLOT_FIELDS = tuple(attr
+                                    for klass in VectorData.__mro__
+                                    for attr in getattr(klass, '__slots__', ())
+                                    if attr != '__dict__')
 
 
 class VectorDataCollection(DataPointCollection):
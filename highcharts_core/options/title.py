@@ -3,9 +3,13 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors
+from highcharts_core import errors, utility_functions
 from highcharts_core.metaclasses import HighchartsMeta
 
+_ALIGN_VALUES = utility_functions.ALIGN_VALUES
+_VERTICAL_ALIGN_VALUES = utility_functions.VERTICAL_ALIGN_VALUES
+_fast_numeric = utility_functions.validate_numeric_fastpath
+
 
 class Title(HighchartsMeta):
     """The chart's main title."""
@@ -33,6 +37,11 @@ class Title(HighchartsMeta):
         self.x = kwargs.get('x', None)
         self.y = kwargs.get('y', None)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name != '_cached_untrimmed':
+            super().__setattr__('_cached_untrimmed', None)
+
     @property
     def _dot_path(self) -> Optional[str]:
         """The dot-notation path to the options key for the current class.
@@ -59,10 +68,14 @@ class Title(HighchartsMeta):
 
     @align.setter
     def align(self, value):
+        if type(value) is str and value in _ALIGN_VALUES:
+            self._align = value
+            return
+
         value = validators.string(value, allow_empty = True)
         if value:
             value = value.lower()
-            if value not in ['left', 'center', 'right']:
+            if value not in _ALIGN_VALUES:
                 raise errors.HighchartsValueError(f'align must be either "left", "center"'
                                                   f', or "right". Was: {value}')
 
@@ -95,7 +108,7 @@ class Title(HighchartsMeta):
 
     @margin.setter
     def margin(self, value):
-        self._margin = validators.numeric(value, allow_empty = True)
+        self._margin = _fast_numeric(value)
 
     @property
     def style(self) -> Optional[str | dict]:
@@ -134,7 +147,10 @@ class Title(HighchartsMeta):
 
     @text.setter
     def text(self, value):
-        self._text = validators.string(value, allow_empty = True)
+        if value is None or type(value) is str:
+            self._text = value or None
+        else:
+            self._text = validators.string(value, allow_empty = True)
 
     @property
     def use_html(self) -> Optional[bool]:
@@ -177,12 +193,16 @@ class Title(HighchartsMeta):
 
     @vertical_align.setter
     def vertical_align(self, value):
+        if type(value) is str and value in _VERTICAL_ALIGN_VALUES:
+            self._vertical_align = value
+            return
+
         value = validators.string(value, allow_empty = True)
         if not value:
             self._vertical_align = None
         else:
             value = value.lower()
-            if value not in ['bottom', 'middle', 'top']:
+            if value not in _VERTICAL_ALIGN_VALUES:
                 raise errors.HighchartsValueError(f'vertical_align expects either "top", '
                                                   f'"middle", or "bottom". Was: {value}')
             self._vertical_align = value
@@ -198,7 +218,7 @@ class Title(HighchartsMeta):
 
     @width_adjust.setter
     def width_adjust(self, value):
-        self._width_adjust = validators.numeric(value, allow_empty = True)
+        self._width_adjust = _fast_numeric(value)
 
     @property
     def x(self) -> Optional[int | float | Decimal]:
@@ -212,7 +232,7 @@ class Title(HighchartsMeta):
 
     @x.setter
     def x(self, value):
-        self._x = validators.numeric(value, allow_empty = True)
+        self._x = _fast_numeric(value)
 
     @property
     def y(self) -> Optional[int | float | Decimal]:
@@ -227,7 +247,7 @@ class Title(HighchartsMeta):
 
     @y.setter
     def y(self, value):
-        self._y = validators.numeric(value, allow_empty = True)
+        self._y = _fast_numeric(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -247,6 +267,10 @@ class Title(HighchartsMeta):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        cached = getattr(self, '_cached_untrimmed', None)
+        if cached is not None:
+            return dict(cached)
+
         untrimmed = {
             'align': self.align,
             'floating': self.floating,
@@ -260,4 +284,6 @@ class Title(HighchartsMeta):
             'y': self.y
         }
 
-        return untrimmed
+        super().__setattr__('_cached_untrimmed', untrimmed)
+
+        return dict(untrimmed)
@@ -1,18 +1,58 @@
+from __future__ import annotations
+
+import operator
+import sys
+
+from importlib import import_module
 from typing import Optional
 from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors
+from highcharts_core import errors, utility_functions
 from highcharts_core.decorators import class_sensitive, validate_types
 from highcharts_core.metaclasses import HighchartsMeta, JavaScriptDict
-from highcharts_core.utility_classes.animation import AnimationOptions
-from highcharts_core.utility_classes.gradients import Gradient
-from highcharts_core.utility_classes.patterns import Pattern
-from highcharts_core.utility_classes.shadows import ShadowOptions
-from highcharts_core.utility_classes.ast import TextPath
 from highcharts_core.utility_classes.javascript_functions import CallbackFunction
 
+#: Names historically importable from this module, resolved lazily via the
+#: PEP 562 module ``__getattr__`` below so that importing ``data_labels`` does
+#: not pull in the animation/gradient/pattern/shadow machinery until one of
+#: those classes is actually needed.
+_LAZY_IMPORTS = {
+    "AnimationOptions": "highcharts_core.utility_classes.animation",
+    "Gradient": "highcharts_core.utility_classes.gradients",
+    "Pattern": "highcharts_core.utility_classes.patterns",
+    "ShadowOptions": "highcharts_core.utility_classes.shadows",
+    "TextPath": "highcharts_core.utility_classes.ast",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+
+    return value
+
+
+_vstring = validators.string
+_vnum = validators.numeric
+_HCE = errors.HighchartsValueError
+
+_ALIGN_VALUES = utility_functions.ALIGN_VALUES
+_OVERFLOW_VALUES = frozenset(("justify", "allow", "none"))
+_POSITION_VALUES = frozenset(("center", "left", "right"))
+_SHAPE_VALUES = frozenset(("callout", "connector", "rect", "circle", "diamond",
+                           "triangle"))
+_VERTICAL_ALIGN_VALUES = utility_functions.VERTICAL_ALIGN_VALUES
+
+_as_str = utility_functions.validate_string_fastpath
+_as_num = utility_functions.validate_numeric_fastpath
+
 
 class Filter(HighchartsMeta):
     """A declarative filter to control of which data labels to display.
@@ -23,6 +63,18 @@ class Filter(HighchartsMeta):
     :meth:`DataLabel.formatter` instead, and return ``undefined`` to disable a single
     data label."""
 
+    __slots__ = (
+        "_operator",
+        "_property",
+        "_value",
+    )
+
+    _KWARG_MAP = (
+        ("operator", "operator"),
+        ("property_", "property"),
+        ("value", "value"),
+    )
+
     def __init__(self, **kwargs):
         self._operator = None
         self._property = None
@@ -51,7 +103,7 @@ class Filter(HighchartsMeta):
 
     @operator.setter
     def operator(self, value):
-        self._operator = validators.string(value, allow_empty=True)
+        self._operator = _as_str(value)
 
     @property
     def property_(self) -> Optional[str]:
@@ -66,7 +118,7 @@ class Filter(HighchartsMeta):
 
     @property_.setter
     def property_(self, value):
-        self._property = validators.string(value, allow_empty=True)
+        self._property = _as_str(value)
 
     @property
     def value(self) -> Optional[int | float | Decimal]:
@@ -78,93 +130,155 @@ class Filter(HighchartsMeta):
 
     @value.setter
     def value(self, value_):
-        self._value = validators.numeric(value_, allow_empty=True)
+        self._value = _as_num(value_)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            "operator": as_dict.get("operator", None),
-            "property_": as_dict.get("property", None),
-            "value": as_dict.get("value", None),
-        }
+        get = as_dict.get
 
-        return kwargs
+        return {python_key: get(json_key, None)
+                for python_key, json_key in cls._KWARG_MAP}
 
-    def _to_untrimmed_dict(self, in_cls=None) -> dict:
-        return {
-            "operator": self.operator,
-            "property": self.property_,
-            "value": self.value,
-        }
+    __serialize_spec__ = (
+        ("operator", "_operator"),
+        ("property", "_property"),
+        ("value", "_value"),
+    )
 
 
 class DataLabel(HighchartsMeta):
     """Options for the series data labels, appearing next to each data point."""
 
+    __slots__ = (
+        "_align",
+        "_allow_overlap",
+        "_animation",
+        "_background_color",
+        "_border_color",
+        "_border_radius",
+        "_border_width",
+        "_class_name",
+        "_color",
+        "_crop",
+        "_defer",
+        "_enabled",
+        "_filter",
+        "_format",
+        "_formatter",
+        "_inside",
+        "_null_format",
+        "_null_formatter",
+        "_overflow",
+        "_padding",
+        "_position",
+        "_rotation",
+        "_shadow",
+        "_shape",
+        "_style",
+        "_text_path",
+        "_use_html",
+        "_vertical_align",
+        "_x",
+        "_y",
+        "_z",
+        "_cached_untrimmed",
+    )
+
+    _KWARG_MAP = (
+        ("align", "align"),
+        ("allow_overlap", "allowOverlap"),
+        ("animation", "animation"),
+        ("background_color", "backgroundColor"),
+        ("border_color", "borderColor"),
+        ("border_radius", "borderRadius"),
+        ("border_width", "borderWidth"),
+        ("class_name", "className"),
+        ("color", "color"),
+        ("crop", "crop"),
+        ("defer", "defer"),
+        ("enabled", "enabled"),
+        ("filter", "filter"),
+        ("format", "format"),
+        ("formatter", "formatter"),
+        ("inside", "inside"),
+        ("null_format", "nullFormat"),
+        ("null_formatter", "nullFormatter"),
+        ("overflow", "overflow"),
+        ("padding", "padding"),
+        ("position", "position"),
+        ("rotation", "rotation"),
+        ("shadow", "shadow"),
+        ("shape", "shape"),
+        ("style", "style"),
+        ("text_path", "textPath"),
+        ("use_html", "useHTML"),
+        ("vertical_align", "verticalAlign"),
+        ("x", "x"),
+        ("y", "y"),
+        ("z", "z"),
+    )
+
     def __init__(self, **kwargs):
-        self._align = None
-        self._allow_overlap = None
-        self._animation = None
-        self._background_color = None
-        self._border_color = None
-        self._border_radius = None
-        self._border_width = None
-        self._class_name = None
-        self._color = None
-        self._crop = None
-        self._defer = None
-        self._enabled = None
-        self._filter = None
-        self._format = None
-        self._formatter = None
-        self._inside = None
-        self._null_format = None
-        self._null_formatter = None
-        self._overflow = None
-        self._padding = None
-        self._position = None
-        self._rotation = None
-        self._shadow = None
-        self._shape = None
-        self._style = None
-        self._text_path = None
-        self._use_html = None
-        self._vertical_align = None
-        self._x = None
-        self._y = None
-        self._z = None
-
-        self.align = kwargs.get("align", None)
-        self.allow_overlap = kwargs.get("allow_overlap", None)
-        self.animation = kwargs.get("animation", None)
-        self.background_color = kwargs.get("background_color", None)
-        self.border_color = kwargs.get("border_color", None)
-        self.border_radius = kwargs.get("border_radius", None)
-        self.border_width = kwargs.get("border_width", None)
-        self.class_name = kwargs.get("class_name", None)
-        self.color = kwargs.get("color", None)
-        self.crop = kwargs.get("crop", None)
-        self.defer = kwargs.get("defer", None)
-        self.enabled = kwargs.get("enabled", None)
-        self.filter = kwargs.get("filter", None)
-        self.format = kwargs.get("format", None)
-        self.formatter = kwargs.get("formatter", None)
-        self.inside = kwargs.get("inside", None)
-        self.null_format = kwargs.get("null_format", None)
-        self.null_formatter = kwargs.get("null_formatter", None)
-        self.overflow = kwargs.get("overflow", None)
-        self.padding = kwargs.get("padding", None)
-        self.position = kwargs.get("position", None)
-        self.rotation = kwargs.get("rotation", None)
-        self.shadow = kwargs.get("shadow", None)
-        self.shape = kwargs.get("shape", None)
-        self.style = kwargs.get("style", None)
-        self.text_path = kwargs.get("text_path", None)
-        self.use_html = kwargs.get("use_html", None)
-        self.vertical_align = kwargs.get("vertical_align", None)
-        self.x = kwargs.get("x", None)
-        self.y = kwargs.get("y", None)
-        self.z = kwargs.get("z", None)
+        if not kwargs:
+            # Every field defaults to None, so a bare DataLabel() can skip the
+            # setter/validator machinery entirely.
+            for attr in DataLabel.__slots__:
+                setattr(self, attr, None)
+
+            return
+
+        get = kwargs.get
+        for attr, _ in DataLabel._KWARG_MAP:
+            setattr(self, attr, get(attr, None))
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name != "_cached_untrimmed":
+            super().__setattr__("_cached_untrimmed", None)
+
+    def _to_untrimmed_dict(self, in_cls=None) -> dict:
+        cached = getattr(self, "_cached_untrimmed", None)
+        if cached is not None:
+            return dict(cached)
+
+        # _SPEC_GETTER pulls every backing field in a single C-level call
+        # instead of one getattr per __serialize_spec__ entry.
+        untrimmed = {key: value
+                     for key, value in zip(self._SPEC_KEYS,
+                                           self._SPEC_GETTER(self))
+                     if value is not None}
+        object.__setattr__(self, "_cached_untrimmed", untrimmed)
+
+        return dict(untrimmed)
+
+    def to_dict(self) -> dict:
+        """Generate a :class:`dict <python:dict>` representation of the object compatible
+        with the Highcharts JavaScript library.
+
+        .. note::
+
+          Scalar values (strings, numbers, booleans) are emitted in a single pass;
+          everything else is routed through
+          :meth:`trim_dict() <HighchartsMeta.trim_dict>` to apply the standard
+          conversion rules.
+
+        :returns: A :class:`dict <python:dict>` representation of the object.
+        :rtype: :class:`dict <python:dict>`
+        """
+        as_dict = {}
+        trim_dict = self.trim_dict
+        context = self.__class__.__name__
+        for key, value in self._to_untrimmed_dict().items():
+            vtype = type(value)
+            if vtype is bool or vtype is int or vtype is float:
+                as_dict[key] = value
+            elif vtype is str:
+                if value:
+                    as_dict[key] = value
+            else:
+                as_dict.update(trim_dict({key: value}, context=context))
+
+        return as_dict
 
     @property
     def align(self) -> Optional[str]:
@@ -191,14 +305,17 @@ class DataLabel(HighchartsMeta):
         if not value:
             self._align = None
         else:
-            value = validators.string(value, allow_empty=False)
-            value = value.lower()
-            if value not in ["left", "center", "right"]:
-                raise errors.HighchartsValueError(
+            value = _vstring(value, allow_empty=False)
+            if value not in _ALIGN_VALUES:
+                value = value.lower()
+            if value not in _ALIGN_VALUES:
+                raise _HCE(
                     f'align must be either "left", '
                     f'"center", or "right". Was: {value}'
                 )
 
+            value = sys.intern(value)
+
         self._align = value
 
     @property
@@ -219,10 +336,7 @@ class DataLabel(HighchartsMeta):
 
     @allow_overlap.setter
     def allow_overlap(self, value):
-        if value is None:
-            self._allow_overlap = None
-        else:
-            self._allow_overlap = bool(value)
+        self._allow_overlap = None if value is None else bool(value)
 
     @property
     def animation(self) -> Optional[AnimationOptions]:
@@ -246,9 +360,13 @@ class DataLabel(HighchartsMeta):
         return self._animation
 
     @animation.setter
-    @class_sensitive(AnimationOptions)
     def animation(self, value):
-        self._animation = value
+        from highcharts_core.utility_classes.animation import AnimationOptions
+
+        if value is None or isinstance(value, AnimationOptions):
+            self._animation = value
+        else:
+            self._animation = validate_types(value, types=AnimationOptions)
 
     @property
     def background_color(self) -> Optional[str | Gradient | Pattern]:
@@ -263,8 +381,6 @@ class DataLabel(HighchartsMeta):
 
     @background_color.setter
     def background_color(self, value):
-        from highcharts_core import utility_functions
-
         self._background_color = utility_functions.validate_color(value)
 
     @property
@@ -279,7 +395,7 @@ class DataLabel(HighchartsMeta):
 
     @border_color.setter
     def border_color(self, value):
-        self._border_color = validators.string(value, allow_empty=True)
+        self._border_color = _as_str(value)
 
     @property
     def border_radius(self) -> Optional[int | float | Decimal]:
@@ -293,7 +409,7 @@ class DataLabel(HighchartsMeta):
 
     @border_radius.setter
     def border_radius(self, value):
-        self._border_radius = validators.numeric(value, allow_empty=True)
+        self._border_radius = _as_num(value)
 
     @property
     def border_width(self) -> Optional[int | float | Decimal]:
@@ -307,7 +423,7 @@ class DataLabel(HighchartsMeta):
 
     @border_width.setter
     def border_width(self, value):
-        self._border_width = validators.numeric(value, allow_empty=True)
+        self._border_width = _as_num(value)
 
     @property
     def class_name(self) -> Optional[str]:
@@ -321,7 +437,7 @@ class DataLabel(HighchartsMeta):
 
     @class_name.setter
     def class_name(self, value):
-        self._class_name = validators.string(value, allow_empty=True)
+        self._class_name = _as_str(value)
 
     @property
     def color(self) -> Optional[str]:
@@ -342,7 +458,7 @@ class DataLabel(HighchartsMeta):
 
     @color.setter
     def color(self, value):
-        self._color = validators.string(value, allow_empty=True)
+        self._color = _as_str(value)
 
     @property
     def crop(self) -> Optional[bool]:
@@ -362,10 +478,7 @@ class DataLabel(HighchartsMeta):
 
     @crop.setter
     def crop(self, value):
-        if value is None:
-            self._crop = None
-        else:
-            self._crop = bool(value)
+        self._crop = None if value is None else bool(value)
 
     @property
     def defer(self) -> Optional[bool | int]:
@@ -386,13 +499,12 @@ class DataLabel(HighchartsMeta):
 
     @defer.setter
     def defer(self, value):
-        if value is None:
-            self._defer = None
+        if value is None or isinstance(value, bool):
+            self._defer = value
+        elif type(value) is int:
+            self._defer = value
         else:
-            if value is True or value is False:
-                self._defer = value
-            else:
-                self._defer = validators.integer(value)
+            self._defer = validators.integer(value)
 
     @property
     def enabled(self) -> Optional[bool]:
@@ -405,10 +517,7 @@ class DataLabel(HighchartsMeta):
 
     @enabled.setter
     def enabled(self, value):
-        if value is None:
-            self._enabled = None
-        else:
-            self._enabled = bool(value)
+        self._enabled = None if value is None else bool(value)
 
     @property
     def filter(self) -> Optional[Filter]:
@@ -448,7 +557,7 @@ class DataLabel(HighchartsMeta):
 
     @format.setter
     def format(self, value):
-        self._format = validators.string(value, allow_empty=True)
+        self._format = _as_str(value)
 
     @property
     def formatter(self) -> Optional[CallbackFunction]:
@@ -482,10 +591,7 @@ class DataLabel(HighchartsMeta):
 
     @inside.setter
     def inside(self, value):
-        if value is None:
-            self._inside = None
-        else:
-            self._inside = bool(value)
+        self._inside = None if value is None else bool(value)
 
     @property
     def null_format(self) -> Optional[str]:
@@ -506,7 +612,7 @@ class DataLabel(HighchartsMeta):
 
     @null_format.setter
     def null_format(self, value):
-        self._null_format = validators.string(value, allow_empty=True)
+        self._null_format = _as_str(value)
 
     @property
     def null_formatter(self) -> Optional[CallbackFunction]:
@@ -559,16 +665,17 @@ class DataLabel(HighchartsMeta):
 
     @overflow.setter
     def overflow(self, value):
-        value = validators.string(value, allow_empty=True)
+        value = _vstring(value, allow_empty=True)
         if not value:
             self._overflow = None
         else:
-            value = value.lower()
-            if value not in ["justify", "allow", "none"]:
-                raise errors.HighchartsValueError(
+            if value not in _OVERFLOW_VALUES:
+                value = value.lower()
+            if value not in _OVERFLOW_VALUES:
+                raise _HCE(
                     f'overflow accepts "justify", "allow", or "none".' f" Was: {value}"
                 )
-            self._overflow = value
+            self._overflow = sys.intern(value)
 
     @property
     def padding(self) -> Optional[int]:
@@ -584,7 +691,7 @@ class DataLabel(HighchartsMeta):
 
     @padding.setter
     def padding(self, value):
-        self._padding = validators.numeric(value, allow_empty=True)
+        self._padding = _as_num(value)
 
     @property
     def position(self) -> Optional[str]:
@@ -610,14 +717,15 @@ class DataLabel(HighchartsMeta):
         if not value:
             self._position = None
         else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ["center", "left", "right"]:
-                raise errors.HighchartsValueError(
+            value = _vstring(value)
+            if value not in _POSITION_VALUES:
+                value = value.lower()
+            if value not in _POSITION_VALUES:
+                raise _HCE(
                     f'position expects a value of "center",'
                     f' "left", or "right". Was: {value}'
                 )
-            self._position = value
+            self._position = sys.intern(value)
 
     @property
     def rotation(self) -> Optional[int | float | Decimal]:
@@ -635,7 +743,7 @@ class DataLabel(HighchartsMeta):
 
     @rotation.setter
     def rotation(self, value):
-        self._rotation = validators.numeric(value, allow_empty=True)
+        self._rotation = _as_num(value)
 
     @property
     def shadow(self) -> Optional[bool | ShadowOptions]:
@@ -657,6 +765,8 @@ class DataLabel(HighchartsMeta):
         elif value is False:
             self._shadow = False
         else:
+            from highcharts_core.utility_classes.shadows import ShadowOptions
+
             value = validate_types(value, types=ShadowOptions)
             self._shadow = value
 
@@ -684,21 +794,15 @@ class DataLabel(HighchartsMeta):
         if not value:
             self._shape = None
         else:
-            value = validators.string(value, allow_empty=False)
-            value = value.lower()
-            if value not in [
-                "callout",
-                "connector",
-                "rect",
-                "circle",
-                "diamond",
-                "triangle",
-            ]:
-                raise errors.HighchartsValueError(
+            value = _vstring(value, allow_empty=False)
+            if value not in _SHAPE_VALUES:
+                value = value.lower()
+            if value not in _SHAPE_VALUES:
+                raise _HCE(
                     f"shape expects a supported annotation "
                     f"label shape. Was: {value}"
                 )
-            self._shape = value
+            self._shape = sys.intern(value)
 
     @property
     def style(self) -> Optional[dict | str]:
@@ -732,7 +836,7 @@ class DataLabel(HighchartsMeta):
         try:
             self._style = validators.dict(value, allow_empty=True)
         except (ValueError, TypeError):
-            self._style = validators.string(value, allow_empty=True)
+            self._style = _vstring(value, allow_empty=True)
 
     @property
     def text_path(self) -> Optional[TextPath]:
@@ -747,9 +851,13 @@ class DataLabel(HighchartsMeta):
         return self._text_path
 
     @text_path.setter
-    @class_sensitive(TextPath)
     def text_path(self, value):
-        self._text_path = value
+        from highcharts_core.utility_classes.ast import TextPath
+
+        if value is None or isinstance(value, TextPath):
+            self._text_path = value
+        else:
+            self._text_path = validate_types(value, types=TextPath)
 
     @property
     def use_html(self) -> Optional[bool]:
@@ -765,10 +873,7 @@ class DataLabel(HighchartsMeta):
 
     @use_html.setter
     def use_html(self, value):
-        if value is None:
-            self._use_html = None
-        else:
-            self._use_html = bool(value)
+        self._use_html = None if value is None else bool(value)
 
     @property
     def vertical_align(self) -> Optional[str]:
@@ -792,17 +897,18 @@ class DataLabel(HighchartsMeta):
 
     @vertical_align.setter
     def vertical_align(self, value):
-        value = validators.string(value, allow_empty=True)
+        value = _vstring(value, allow_empty=True)
         if not value:
             self._vertical_align = None
         else:
-            value = value.lower()
-            if value not in ["bottom", "middle", "top"]:
-                raise errors.HighchartsValueError(
+            if value not in _VERTICAL_ALIGN_VALUES:
+                value = value.lower()
+            if value not in _VERTICAL_ALIGN_VALUES:
+                raise _HCE(
                     f'vertical_align expects either "top", '
                     f'"middle", or "bottom". Was: {value}'
                 )
-            self._vertical_align = value
+            self._vertical_align = sys.intern(value)
 
     @property
     def x(self) -> Optional[int | float | Decimal]:
@@ -815,7 +921,7 @@ class DataLabel(HighchartsMeta):
 
     @x.setter
     def x(self, value):
-        self._x = validators.numeric(value, allow_empty=True)
+        self._x = _as_num(value)
 
     @property
     def y(self) -> Optional[int | float | Decimal]:
@@ -828,7 +934,7 @@ class DataLabel(HighchartsMeta):
 
     @y.setter
     def y(self, value):
-        self._y = validators.numeric(value, allow_empty=True)
+        self._y = _as_num(value)
 
     @property
     def z(self) -> Optional[int]:
@@ -847,87 +953,61 @@ class DataLabel(HighchartsMeta):
 
     @z.setter
     def z(self, value):
-        self._z = validators.numeric(value, allow_empty=True)
+        self._z = _as_num(value)
+
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            "align": as_dict.get("align", None),
-            "allow_overlap": as_dict.get("allowOverlap", None),
-            "animation": as_dict.get("animation", None),
-            "background_color": as_dict.get("backgroundColor", None),
-            "border_color": as_dict.get("borderColor", None),
-            "border_radius": as_dict.get("borderRadius", None),
-            "border_width": as_dict.get("borderWidth", None),
-            "class_name": as_dict.get("className", None),
-            "color": as_dict.get("color", None),
-            "crop": as_dict.get("crop", None),
-            "defer": as_dict.get("defer", None),
-            "enabled": as_dict.get("enabled", None),
-            "filter": as_dict.get("filter", None),
-            "format": as_dict.get("format", None),
-            "formatter": as_dict.get("formatter", None),
-            "inside": as_dict.get("inside", None),
-            "null_format": as_dict.get("nullFormat", None),
-            "null_formatter": as_dict.get("nullFormatter", None),
-            "overflow": as_dict.get("overflow", None),
-            "padding": as_dict.get("padding", None),
-            "position": as_dict.get("position", None),
-            "rotation": as_dict.get("rotation", None),
-            "shadow": as_dict.get("shadow", None),
-            "shape": as_dict.get("shape", None),
-            "style": as_dict.get("style", None),
-            "text_path": as_dict.get("textPath", None),
-            "use_html": as_dict.get("useHTML", None),
-            "vertical_align": as_dict.get("verticalAlign", None),
-            "x": as_dict.get("x", None),
-            "y": as_dict.get("y", None),
-            "z": as_dict.get("z", None),
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls=None) -> dict:
-        untrimmed = {
-            "align": self.align,
-            "allowOverlap": self.allow_overlap,
-            "animation": self.animation,
-            "backgroundColor": self.background_color,
-            "borderColor": self.border_color,
-            "borderRadius": self.border_radius,
-            "borderWidth": self.border_width,
-            "className": self.class_name,
-            "color": self.color,
-            "crop": self.crop,
-            "defer": self.defer,
-            "enabled": self.enabled,
-            "filter": self.filter,
-            "format": self.format,
-            "formatter": self.formatter,
-            "inside": self.inside,
-            "nullFormat": self.null_format,
-            "nullFormatter": self.null_formatter,
-            "overflow": self.overflow,
-            "padding": self.padding,
-            "position": self.position,
-            "rotation": self.rotation,
-            "shadow": self.shadow,
-            "shape": self.shape,
-            "style": self.style,
-            "textPath": self.text_path,
-            "useHTML": self.use_html,
-            "verticalAlign": self.vertical_align,
-            "x": self.x,
-            "y": self.y,
-            "z": self.z,
-        }
-
-        return untrimmed
+        get = as_dict.get
+
+        return {python_key: value
+                for python_key, json_key in cls._KWARG_MAP
+                if (value := get(json_key, None)) is not None}
+
+    __serialize_spec__ = (
+        ("align", "_align"),
+        ("allowOverlap", "_allow_overlap"),
+        ("animation", "_animation"),
+        ("backgroundColor", "_background_color"),
+        ("borderColor", "_border_color"),
+        ("borderRadius", "_border_radius"),
+        ("borderWidth", "_border_width"),
+        ("className", "_class_name"),
+        ("color", "_color"),
+        ("crop", "_crop"),
+        ("defer", "_defer"),
+        ("enabled", "_enabled"),
+        ("filter", "_filter"),
+        ("format", "_format"),
+        ("formatter", "_formatter"),
+        ("inside", "_inside"),
+        ("nullFormat", "_null_format"),
+        ("nullFormatter", "_null_formatter"),
+        ("overflow", "_overflow"),
+        ("padding", "_padding"),
+        ("position", "_position"),
+        ("rotation", "_rotation"),
+        ("shadow", "_shadow"),
+        ("shape", "_shape"),
+        ("style", "_style"),
+        ("textPath", "_text_path"),
+        ("useHTML", "_use_html"),
+        ("verticalAlign", "_vertical_align"),
+        ("x", "_x"),
+        ("y", "_y"),
+        ("z", "_z"),
+    )
 
 
 class PieDataLabel(DataLabel):
     """Variant of :class:`DataLabel` used for pie (and related) series."""
 
+    __slots__ = ("_distance",)
+
+    _KWARG_MAP = DataLabel._KWARG_MAP + (
+        ("distance", "distance"),
+    )
+
     def __init__(self, **kwargs):
         self._distance = None
 
@@ -961,10 +1041,10 @@ class PieDataLabel(DataLabel):
             self._distance = None
         else:
             try:
-                value = validators.numeric(value, allow_empty=False)
+                value = _vnum(value, allow_empty=False)
             except (ValueError, TypeError):
                 if not isinstance(value, str):
-                    raise errors.HighchartsValueError(
+                    raise _HCE(
                         f"distance must be a number or a string, but received "
                         f"{type(value).__name__}."
                     )
@@ -973,60 +1053,21 @@ class PieDataLabel(DataLabel):
 
             self._distance = value
 
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            "align": as_dict.get("align", None),
-            "allow_overlap": as_dict.get("allowOverlap", None),
-            "animation": as_dict.get("animation", None),
-            "background_color": as_dict.get("backgroundColor", None),
-            "border_color": as_dict.get("borderColor", None),
-            "border_radius": as_dict.get("borderRadius", None),
-            "border_width": as_dict.get("borderWidth", None),
-            "class_name": as_dict.get("className", None),
-            "color": as_dict.get("color", None),
-            "crop": as_dict.get("crop", None),
-            "defer": as_dict.get("defer", None),
-            "enabled": as_dict.get("enabled", None),
-            "filter": as_dict.get("filter", None),
-            "format": as_dict.get("format", None),
-            "formatter": as_dict.get("formatter", None),
-            "inside": as_dict.get("inside", None),
-            "null_format": as_dict.get("nullFormat", None),
-            "null_formatter": as_dict.get("nullFormatter", None),
-            "overflow": as_dict.get("overflow", None),
-            "padding": as_dict.get("padding", None),
-            "position": as_dict.get("position", None),
-            "rotation": as_dict.get("rotation", None),
-            "shadow": as_dict.get("shadow", None),
-            "shape": as_dict.get("shape", None),
-            "style": as_dict.get("style", None),
-            "text_path": as_dict.get("textPath", None),
-            "use_html": as_dict.get("useHTML", None),
-            "vertical_align": as_dict.get("verticalAlign", None),
-            "x": as_dict.get("x", None),
-            "y": as_dict.get("y", None),
-            "z": as_dict.get("z", None),
-            "distance": as_dict.get("distance", None),
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls=None) -> dict:
-        untrimmed = {
-            "distance": self.distance,
-        }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls=in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
-
-        return untrimmed
+    __serialize_spec__ = (
+        ("distance", "_distance"),
+    ) + DataLabel.__serialize_spec__
 
 
 class SunburstDataLabel(DataLabel):
     """Variant of :class:`DataLabel` used for :term:`sunburst` series."""
 
+    __slots__ = ("_rotation_mode",)
+
+    _KWARG_MAP = DataLabel._KWARG_MAP + (
+        ("rotation_mode", "rotationMode"),
+    )
+
     def __init__(self, **kwargs):
         self._rotation_mode = None
 
@@ -1069,10 +1110,10 @@ class SunburstDataLabel(DataLabel):
         if not value:
             self._rotation_mode = None
         else:
-            value = validators.string(value, allow_empty=False)
+            value = _vstring(value, allow_empty=False)
             value = value.lower()
             if value not in ["circular", "auto", "parallel", "perpendicular"]:
-                raise errors.HighchartsValueError(
+                raise _HCE(
                     f"if not empty, rotation_mode expects a value of either "
                     f'"circular", "auto", "parallel", or "perpendicular", '
                     f' but received "{str}".'
@@ -1080,60 +1121,27 @@ class SunburstDataLabel(DataLabel):
 
             self._rotation_mode = value
 
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            "align": as_dict.get("align", None),
-            "allow_overlap": as_dict.get("allowOverlap", None),
-            "animation": as_dict.get("animation", None),
-            "background_color": as_dict.get("backgroundColor", None),
-            "border_color": as_dict.get("borderColor", None),
-            "border_radius": as_dict.get("borderRadius", None),
-            "border_width": as_dict.get("borderWidth", None),
-            "class_name": as_dict.get("className", None),
-            "color": as_dict.get("color", None),
-            "crop": as_dict.get("crop", None),
-            "defer": as_dict.get("defer", None),
-            "enabled": as_dict.get("enabled", None),
-            "filter": as_dict.get("filter", None),
-            "format": as_dict.get("format", None),
-            "formatter": as_dict.get("formatter", None),
-            "inside": as_dict.get("inside", None),
-            "null_format": as_dict.get("nullFormat", None),
-            "null_formatter": as_dict.get("nullFormatter", None),
-            "overflow": as_dict.get("overflow", None),
-            "padding": as_dict.get("padding", None),
-            "position": as_dict.get("position", None),
-            "rotation": as_dict.get("rotation", None),
-            "shadow": as_dict.get("shadow", None),
-            "shape": as_dict.get("shape", None),
-            "style": as_dict.get("style", None),
-            "text_path": as_dict.get("textPath", None),
-            "use_html": as_dict.get("useHTML", None),
-            "vertical_align": as_dict.get("verticalAlign", None),
-            "x": as_dict.get("x", None),
-            "y": as_dict.get("y", None),
-            "z": as_dict.get("z", None),
-            "rotation_mode": as_dict.get("rotationMode", None),
-        }
-
-        return kwargs
-
-    def _to_untrimmed_dict(self, in_cls=None) -> dict:
-        untrimmed = {
-            "rotationMode": self.rotation_mode,
-        }
-
-        parent_as_dict = super()._to_untrimmed_dict(in_cls=in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
 
-        return untrimmed
+    __serialize_spec__ = (
+        ("rotationMode", "_rotation_mode"),
+    ) + DataLabel.__serialize_spec__
 
 
 class OrganizationDataLabel(DataLabel):
     """Variant of :class:`DataLabel` used for :term:`organization` series."""
 
+    __slots__ = (
+        "_link_format",
+        "_link_formatter",
+        "_link_text_path",
+    )
+
+    _KWARG_MAP = DataLabel._KWARG_MAP + (
+        ("link_format", "linkFormat"),
+        ("link_formatter", "linkFormatter"),
+        ("link_text_path", "linkTextPath"),
+    )
+
     def __init__(self, **kwargs):
         self._link_format = None
         self._link_formatter = None
@@ -1161,7 +1169,7 @@ class OrganizationDataLabel(DataLabel):
 
     @link_format.setter
     def link_format(self, value):
-        self._link_format = validators.string(value, allow_empty=True)
+        self._link_format = _vstring(value, allow_empty=True)
 
     @property
     def link_formatter(self) -> Optional[CallbackFunction]:
@@ -1195,68 +1203,35 @@ class OrganizationDataLabel(DataLabel):
         return self._link_text_path
 
     @link_text_path.setter
-    @class_sensitive(TextPath)
     def link_text_path(self, value):
-        self._link_text_path = value
-
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            "align": as_dict.get("align", None),
-            "allow_overlap": as_dict.get("allowOverlap", None),
-            "animation": as_dict.get("animation", None),
-            "background_color": as_dict.get("backgroundColor", None),
-            "border_color": as_dict.get("borderColor", None),
-            "border_radius": as_dict.get("borderRadius", None),
-            "border_width": as_dict.get("borderWidth", None),
-            "class_name": as_dict.get("className", None),
-            "color": as_dict.get("color", None),
-            "crop": as_dict.get("crop", None),
-            "defer": as_dict.get("defer", None),
-            "enabled": as_dict.get("enabled", None),
-            "filter": as_dict.get("filter", None),
-            "format": as_dict.get("format", None),
-            "formatter": as_dict.get("formatter", None),
-            "inside": as_dict.get("inside", None),
-            "null_format": as_dict.get("nullFormat", None),
-            "null_formatter": as_dict.get("nullFormatter", None),
-            "overflow": as_dict.get("overflow", None),
-            "padding": as_dict.get("padding", None),
-            "position": as_dict.get("position", None),
-            "rotation": as_dict.get("rotation", None),
-            "shadow": as_dict.get("shadow", None),
-            "shape": as_dict.get("shape", None),
-            "style": as_dict.get("style", None),
-            "text_path": as_dict.get("textPath", None),
-            "use_html": as_dict.get("useHTML", None),
-            "vertical_align": as_dict.get("verticalAlign", None),
-            "x": as_dict.get("x", None),
-            "y": as_dict.get("y", None),
-            "z": as_dict.get("z", None),
-            "link_format": as_dict.get("linkFormat", None),
-            "link_formatter": as_dict.get("linkFormatter", None),
-            "link_text_path": as_dict.get("linkTextPath", None),
-        }
-
-        return kwargs
+        from highcharts_core.utility_classes.ast import TextPath
 
-    def _to_untrimmed_dict(self, in_cls=None) -> dict:
-        untrimmed = {
-            "linkFormat": self.link_format,
-            "linkFormatter": self.link_formatter,
-            "linkTextPath": self.link_text_path,
-        }
+        if value is None or isinstance(value, TextPath):
+            self._link_text_path = value
+        else:
+            self._link_text_path = validate_types(value, types=TextPath)
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls=in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
 
-        return untrimmed
+    __serialize_spec__ = (
+        ("linkFormat", "_link_format"),
+        ("linkFormatter", "_link_formatter"),
+        ("linkTextPath", "_link_text_path"),
+    ) + DataLabel.__serialize_spec__
 
 
 class NodeDataLabel(DataLabel):
     """Variant of :class:`DataLabel` used for node-based charts/diagrams."""
 
+    __slots__ = (
+        "_node_format",
+        "_node_formatter",
+    )
+
+    _KWARG_MAP = DataLabel._KWARG_MAP + (
+        ("node_format", "nodeFormat"),
+        ("node_formatter", "nodeFormatter"),
+    )
+
     def __init__(self, **kwargs):
         self._node_format = None
         self._node_formatter = None
@@ -1277,7 +1252,7 @@ class NodeDataLabel(DataLabel):
 
     @node_format.setter
     def node_format(self, value):
-        self._node_format = validators.string(value, allow_empty=True)
+        self._node_format = _vstring(value, allow_empty=True)
 
     @property
     def node_formatter(self) -> Optional[CallbackFunction]:
@@ -1298,57 +1273,11 @@ class NodeDataLabel(DataLabel):
     def node_formatter(self, value):
         self._node_formatter = value
 
-    @classmethod
-    def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            "align": as_dict.get("align", None),
-            "allow_overlap": as_dict.get("allowOverlap", None),
-            "animation": as_dict.get("animation", None),
-            "background_color": as_dict.get("backgroundColor", None),
-            "border_color": as_dict.get("borderColor", None),
-            "border_radius": as_dict.get("borderRadius", None),
-            "border_width": as_dict.get("borderWidth", None),
-            "class_name": as_dict.get("className", None),
-            "color": as_dict.get("color", None),
-            "crop": as_dict.get("crop", None),
-            "defer": as_dict.get("defer", None),
-            "enabled": as_dict.get("enabled", None),
-            "filter": as_dict.get("filter", None),
-            "format": as_dict.get("format", None),
-            "formatter": as_dict.get("formatter", None),
-            "inside": as_dict.get("inside", None),
-            "null_format": as_dict.get("nullFormat", None),
-            "null_formatter": as_dict.get("nullFormatter", None),
-            "overflow": as_dict.get("overflow", None),
-            "padding": as_dict.get("padding", None),
-            "position": as_dict.get("position", None),
-            "rotation": as_dict.get("rotation", None),
-            "shadow": as_dict.get("shadow", None),
-            "shape": as_dict.get("shape", None),
-            "style": as_dict.get("style", None),
-            "text_path": as_dict.get("textPath", None),
-            "use_html": as_dict.get("useHTML", None),
-            "vertical_align": as_dict.get("verticalAlign", None),
-            "x": as_dict.get("x", None),
-            "y": as_dict.get("y", None),
-            "z": as_dict.get("z", None),
-            "node_format": as_dict.get("nodeFormat", None),
-            "node_formatter": as_dict.get("nodeFormatter", None),
-        }
-
-        return kwargs
 
-    def _to_untrimmed_dict(self, in_cls=None) -> dict:
-        untrimmed = {
-            "nodeFormat": self.node_format,
-            "nodeFormatter": self.node_formatter,
-        }
-
-        parent_as_dict = super()._to_untrimmed_dict(in_cls=in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
-
-        return untrimmed
+    __serialize_spec__ = (
+        ("nodeFormat", "_node_format"),
+        ("nodeFormatter", "_node_formatter"),
+    ) + DataLabel.__serialize_spec__
 
 
 data_label_property_map = {
@@ -1357,3 +1286,55 @@ data_label_property_map = {
     "link_format|link_formatter|link_text_path": OrganizationDataLabel,
     "node_format|node_formatter": NodeDataLabel,
 }
+
+
+# Intern the JSON-side key strings in the class-level key tables so the dict
+# probes performed during (de)serialization can short-circuit on pointer
+# identity rather than falling through to a full string comparison.
+for _cls in (Filter, DataLabel, PieDataLabel, SunburstDataLabel,
+             OrganizationDataLabel, NodeDataLabel):
+    _cls._KWARG_MAP = tuple((python_key, sys.intern(json_key))
+                            for python_key, json_key in _cls._KWARG_MAP)
+    _cls.__serialize_spec__ = tuple((sys.intern(json_key), backing_field)
+                                    for json_key, backing_field
+                                    in _cls.__serialize_spec__)
+
+
+def _specialized_get_kwargs_from_dict(kwarg_map):
+    """Generate a ``_get_kwargs_from_dict`` classmethod specialized for
+    ``kwarg_map``, with every key pair inlined as a compile-time constant so
+    that the per-call iteration over the map disappears.
+
+    :rtype: :class:`classmethod <python:classmethod>`
+    """
+    lines = ['def _get_kwargs_from_dict(cls, as_dict):',
+             '    get = as_dict.get',
+             '    kwargs = {}']
+    for python_key, json_key in kwarg_map:
+        lines.append(f'    if (value := get({json_key!r}, None)) is not None:')
+        lines.append(f'        kwargs[{python_key!r}] = value')
+    lines.append('    return kwargs')
+
+    namespace = {}
+    exec(compile('\n'.join(lines), __file__, 'exec'), namespace)
+    generated = namespace['_get_kwargs_from_dict']
+    generated.__doc__ = DataLabel._get_kwargs_from_dict.__doc__
+    generated.__qualname__ = '_get_kwargs_from_dict'
+
+    return classmethod(generated)
+
+
+# Replace the generic, map-driven _get_kwargs_from_dict on each class with a
+# version generated for its own key map, and pre-compute the key tuple and
+# (C-implemented) attrgetter consumed by DataLabel._to_untrimmed_dict.
+for _cls in (DataLabel, PieDataLabel, SunburstDataLabel,
+             OrganizationDataLabel, NodeDataLabel):
+    _cls._get_kwargs_from_dict = _specialized_get_kwargs_from_dict(_cls._KWARG_MAP)
+    _cls._SPEC_KEYS = tuple(json_key
+                            for json_key, backing_field
+                            in _cls.__serialize_spec__)
+    _cls._SPEC_GETTER = operator.attrgetter(*(backing_field
+                                              for json_key, backing_field
+                                              in _cls.__serialize_spec__))
+
+del _cls
@@ -130,6 +130,76 @@ def mro__to_untrimmed_dict(obj, in_cls = None):
     return consolidated
 
 
+def _gradient_from_serialized(value):
+    """Resolve a JSON string or :class:`dict <python:dict>` to a :class:`Gradient`."""
+    from highcharts_core.utility_classes.gradients import Gradient
+
+    if isinstance(value, dict):
+        return Gradient.from_dict(value)
+
+    if value.lstrip().startswith('{'):
+        try:
+            return Gradient.from_json(value)
+        except (TypeError, ValueError):
+            pass
+
+    return validators.string(value)
+
+
+def _gradient_from_kwargs(value):
+    """Resolve a :class:`dict <python:dict>` of keyword arguments to a
+    :class:`Gradient`."""
+    from highcharts_core.utility_classes.gradients import Gradient
+
+    return Gradient(**value)
+
+
+def _pattern_from_serialized(value):
+    """Resolve a JSON string or :class:`dict <python:dict>` to a :class:`Pattern`."""
+    from highcharts_core.utility_classes.patterns import Pattern
+
+    if isinstance(value, dict):
+        return Pattern.from_dict(value)
+
+    if value.lstrip().startswith('{'):
+        try:
+            return Pattern.from_json(value)
+        except (TypeError, ValueError):
+            pass
+
+    return validators.string(value)
+
+
+def _pattern_from_kwargs(value):
+    """Resolve a :class:`dict <python:dict>` of keyword arguments to a
+    :class:`Pattern`."""
+    from highcharts_core.utility_classes.patterns import Pattern
+
+    return Pattern(**value)
+
+
+#: Marker key -> handler used by :func:`validate_color` for
+#: :class:`dict <python:dict>` values, checked in priority order.
+_DICT_COLOR_HANDLERS = {
+    'linearGradient': _gradient_from_serialized,
+    'radialGradient': _gradient_from_serialized,
+    'linear_gradient': _gradient_from_kwargs,
+    'radial_gradient': _gradient_from_kwargs,
+    'patternOptions': _pattern_from_serialized,
+    'pattern': _pattern_from_serialized,
+    'pattern_options': _pattern_from_kwargs,
+}
+
+#: Marker substring -> handler used by :func:`validate_color` for
+#: :class:`str <python:str>` values, checked in priority order.
+_STR_COLOR_HANDLERS = {
+    'linearGradient': _gradient_from_serialized,
+    'radialGradient': _gradient_from_serialized,
+    'patternOptions': _pattern_from_serialized,
+    'pattern': _pattern_from_serialized,
+}
+
+
 def validate_color(value):
     """Validate that ``value`` is either a :class:`Gradient`, :class:`Pattern`, or a
     :class:`str <python:str>`.
@@ -149,37 +219,70 @@ def validate_color(value):
         return value
     elif isinstance(value, (Gradient, Pattern)):
         return value
-    elif isinstance(value, (dict, str)) and ('linearGradient' in value or
-                                             'radialGradient' in value):
-        try:
-            value = Gradient.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Gradient.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and ('linear_gradient' in value or
-                                      'radial_gradient' in value):
-        value = Gradient(**value)
-    elif isinstance(value, (dict, str)) and ('patternOptions' in value or
-                                             'pattern' in value):
-        try:
-            value = Pattern.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Pattern.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and 'pattern_options' in value:
-        value = Pattern(**value)
+
+    if isinstance(value, dict):
+        handlers = _DICT_COLOR_HANDLERS
     elif isinstance(value, str):
-        value = validators.string(value)
+        handlers = _STR_COLOR_HANDLERS
     else:
         raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
                                           f'Gradient, or Pattern. Value received '
                                           f'was: {value}')
 
-    return value
+    for marker in handlers:
+        if marker in value:
+            return handlers[marker](value)
+
+    if isinstance(value, str):
+        return validators.string(value)
+
+    raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
+                                      f'Gradient, or Pattern. Value received '
+                                      f'was: {value}')
+
+
+#: Accepted values for horizontal alignment options.
+ALIGN_VALUES = frozenset(('left', 'center', 'right'))
+
+#: Accepted values for vertical alignment options.
+VERTICAL_ALIGN_VALUES = frozenset(('bottom', 'middle', 'top'))
+
+#: Numeric types that setter fast paths can store without validation.
+#: Deliberately matched by ``type(value) in ...`` rather than ``isinstance``
+#: so that :class:`bool <python:bool>` values still go through the validators.
+FAST_NUMERIC_TYPES = (int, float)
+
+
+def validate_numeric_fastpath(value):
+    """Validate ``value`` as an (optional) number, bypassing
+    :func:`validators.numeric <validator_collection:validator_collection.validators.numeric>`
+    when it is already an :class:`int <python:int>` or :class:`float <python:float>`.
+
+    :param value: The value to validate.
+
+    :rtype: numeric or :obj:`None <python:None>`
+    """
+    if value is None or type(value) in FAST_NUMERIC_TYPES:
+        return value
+
+    return validators.numeric(value, allow_empty = True)
+
+
+def validate_string_fastpath(value):
+    """Validate ``value`` as an (optional) string, bypassing
+    :func:`validators.string <validator_collection:validator_collection.validators.string>`
+    when it is already a :class:`str <python:str>` or :obj:`None <python:None>`.
+
+    :param value: The value to validate.
+
+    :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+    """
+    if value is None:
+        return None
+    if type(value) is str:
+        return value or None
+
+    return validators.string(value, allow_empty = True)
 
 
 def to_camelCase(snake_case):
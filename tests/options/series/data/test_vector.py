@@ -780,12 +780,32 @@ def test_VectorData_to_array(input_array, set_props, expected_type, expected):
     for data_point in iterable:
         for key in set_props:
             setattr(data_point, key, set_props[key])
-    
+
     results = []
     for data_point in iterable:
         result = data_point.to_array()
         assert isinstance(result, expected_type) is True
         results.append(result)
-        
+
     if expected_type == list:
         assert results == expected
+
+
+@pytest.mark.parametrize('input_array, set_props', [
+    ([], {}),
+    ([[123, 456, 789, 987], [789, 123, 456, 789]], {}),
+    ([['A', 456, 789, 987], ['B', 123, 456, 789]], {}),
+    ([[123, 456, 789], [789, 123, 456]], {}),
+
+    ([[123, 456, 789, 987], [789, 123, 456, 789]], {'id': 'some_id'}),
+    ([[123, 456, 789], [789, 123, 456]], {'color': '#ccc'}),
+])
+def test_VectorData_to_array_batch(input_array, set_props):
+    iterable = cls.from_array(input_array)
+    for data_point in iterable:
+        for key in set_props:
+            setattr(data_point, key, set_props[key])
+
+    results = cls.to_array_batch(iterable)
+
+    assert results == [data_point.to_array() for data_point in iterable]